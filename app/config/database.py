@@ -2,21 +2,61 @@
 Database configuration and session management.
 """
 
-from sqlalchemy import create_engine
+import os
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
 
-# SQLite database URL - will create users.db file in current directory
-DATABASE_URL = "sqlite:///./users.db"
+# SQLite database URL - defaults to users.db file in current directory
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./users.db")
 
 # Create SQLAlchemy engine
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Needed for SQLite
+    connect_args={
+        "check_same_thread": False,  # Needed for SQLite
+        "timeout": 30,  # Seconds to wait on a locked database
+    },
+    # Keep connections open between requests instead of reopening the file
+    poolclass=QueuePool,
+    pool_size=10,
+    max_overflow=20,
     echo=False,  # Set to True to see SQL queries in logs
 )
 
+# SQLite PRAGMAs applied to every new DBAPI connection
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",  # Readers don't block the writer
+    "synchronous=NORMAL",  # No fsync per commit (safe with WAL)
+    "temp_store=MEMORY",
+    "cache_size=-64000",  # ~64MB page cache
+    "foreign_keys=ON",
+)
+
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(
+    dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry
+) -> None:
+    """
+    Tune each raw SQLite connection as soon as it is opened.
+
+    Registered at import time, so it is in place before
+    create_tables() opens the first connection.
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
 # Create SessionLocal class for database sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: reading a just-committed object must not re-SELECT it
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
+)
 
 
 class Base(DeclarativeBase):
@@ -44,6 +84,16 @@ def create_tables() -> None:
     Create all database tables.
 
     This should be called on application startup to ensure
-    all tables exist before handling requests.
+    all tables exist before handling requests. It also brings
+    tables created by older versions up to date.
     """
     Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        # create_all() skips indexes on tables that already exist
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+        # Tables from before is_delete became NOT NULL keep their NULL rows,
+        # which every "is_delete = 0" read would skip
+        conn.exec_driver_sql("UPDATE users SET is_delete = 0 WHERE is_delete IS NULL")
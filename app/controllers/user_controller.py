@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
@@ -5,6 +7,7 @@ from sqlalchemy.exc import IntegrityError
 from app.config.database import get_db
 
 from app.schemas.user_schema import (
+    SuccessResponse,
     UserCreate,
     UserListResponse,
     UserResponse,
@@ -15,42 +18,56 @@ from app.utils.response import response_created, response_success
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+# Handlers are plain `def`: the Session calls block, so FastAPI runs them in
+# its threadpool instead of stalling the event loop.
+
 
 @router.post(
     "",
     status_code=status.HTTP_201_CREATED,
     summary="Create User",
 )
-async def create_user(user_data: UserCreate, db: Session = Depends(get_db)):
+def create_user(user_data: UserCreate, db: Session = Depends(get_db)):
     user = user_service.create_user(db, user_data)
-    return response_created(user)
+    return response_created(UserResponse.model_validate(user))
 
 
-@router.get("", summary="List Users")
-async def list_users(
+@router.get(
+    "",
+    summary="List Users",
+    response_model=SuccessResponse[UserListResponse],
+)
+def list_users(
     limit: int = Query(default=10, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    after_created_at: datetime | None = Query(
+        default=None, description="Keyset cursor: created_at of the last user seen"
+    ),
+    after_id: int | None = Query(
+        default=None, ge=1, description="Keyset cursor: id of the last user seen"
+    ),
     db: Session = Depends(get_db),
 ):
-    users = user_service.list_users(db, limit, offset)
+    users = user_service.list_users(db, limit, offset, after_created_at, after_id)
+    # response_model only documents the envelope; returning a Response skips
+    # FastAPI's re-validation, and the page goes through the same orjson
+    # encoder as every other endpoint
     return response_success(users)
 
 
 @router.get("/{user_id}", summary="Get User")
-async def get_user(user_id: int, db: Session = Depends(get_db)):
+def get_user(user_id: int, db: Session = Depends(get_db)):
     user = user_service.get_user(db, user_id)
-    return response_success(user)
+    return response_success(UserResponse.model_validate(user))
 
 
 @router.put("/{user_id}")
-async def update_user_by_id(
-    user_id: int, data: UserUpdate, db: Session = Depends(get_db)
-):
+def update_user_by_id(user_id: int, data: UserUpdate, db: Session = Depends(get_db)):
     user = user_service.update_user_by_id(db, user_id, data)
-    return response_success(user)
+    return response_success(UserResponse.model_validate(user))
 
 
 @router.delete("/{user_id}")
-async def delete_user_by_id(user_id: int, db: Session = Depends(get_db)):
+def delete_user_by_id(user_id: int, db: Session = Depends(get_db)):
     res = user_service.delete_user_by_id(db, user_id)
     return response_success(message=res)
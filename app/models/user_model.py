@@ -5,7 +5,7 @@ SQLAlchemy database models.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, DateTime, Index, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.config.database import Base
@@ -19,12 +19,16 @@ class User(Base):
         id: Primary key, auto-incrementing integer
         name: User's full name
         email: User's email address (must be unique)
+        is_delete: Soft-delete flag, false for active users
         created_at: Timestamp when the user was created
         updated_at: Timestamp when the user was last updated
     """
 
     __tablename__ = "users"
 
+    # Fetch server-generated values (updated_at on UPDATE) via RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
 
@@ -34,7 +38,10 @@ class User(Base):
         String(255), unique=True, index=True, nullable=False
     )
 
-    is_delete: Mapped[bool] = mapped_column(Boolean, nullable=True)
+    # Soft-delete flag, indexed through ix_users_active_created
+    is_delete: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, server_default=text("0")
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -47,3 +54,13 @@ class User(Base):
     def __repr__(self) -> str:
         """String representation of User object."""
         return f"<User(id={self.id}, name='{self.name}', email='{self.email}')>"
+
+
+# Active-users listing and keyset pagination: equality on is_delete, then
+# already in (created_at, id) list order
+Index(
+    "ix_users_active_created",
+    User.is_delete,
+    User.created_at.desc(),
+    User.id.desc(),
+)
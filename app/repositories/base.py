@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -17,12 +17,20 @@ class BaseRepository:
             db.rollback()
             raise
 
-    def update_by_id(self, db: Session, obj_id: int, data: Dict[str, Any]):
+    def update_by_id(
+        self,
+        db: Session,
+        obj_id: int,
+        data: Dict[str, Any],
+        db_obj: Optional[Any] = None,
+    ):
         """
         Update object by id — repo không lo object có tồn tại hay không.
         Service sẽ kiểm tra trước khi gọi method này.
+        Truyền db_obj nếu service đã load object, để khỏi query lại.
         """
-        db_obj = db.query(self.model).filter(self.model.id == obj_id).first()
+        if db_obj is None:
+            db_obj = db.get(self.model, obj_id)
 
         # Không quan tâm None, service phải xử lý trước
         if not db_obj:
@@ -33,9 +41,7 @@ class BaseRepository:
             if hasattr(db_obj, key):
                 setattr(db_obj, key, value)
 
-        # Commit
+        # Commit — updated_at comes back via UPDATE ... RETURNING, no refresh
         self.commit_or_rollback(db)
 
-        # Refresh
-        db.refresh(db_obj)
         return db_obj
@@ -1,56 +1,169 @@
+from datetime import datetime
+from typing import Any
+
 from sqlalchemy.orm import Session
-from sqlalchemy import exists, func
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Row, func, insert, lambda_stmt, select, text, tuple_, update
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.repositories.base import BaseRepository
 from app.models.user_model import User
 from app.schemas.user_schema import UserCreate, UserUpdate
 
+# Constant SQL text, so sqlite3's prepared-statement cache hits every call
+_GET_BY_ID = text(
+    "SELECT id, name, email, created_at, updated_at FROM users "
+    "WHERE id = :id AND is_delete = 0"
+).columns(User.id, User.name, User.email, User.created_at, User.updated_at)
+
+# Emails stay unique across soft-deleted users too, so no is_delete filter
+_EMAIL_EXISTS = text(
+    "SELECT 1 FROM users "
+    "WHERE email = :email AND (:exclude_id IS NULL OR id <> :exclude_id) "
+    "LIMIT 1"
+)
+
 
 class UserRepository(BaseRepository):
     model = User
 
     def create_user(self, db: Session, data: UserCreate) -> User:
-        new_user = User(name=data.name, email=data.email)
-
-        db.add(new_user)
+        # RETURNING hands back the server-generated columns, no refresh SELECT.
+        # is_delete is explicit: tables created before its server default have
+        # no DEFAULT and would store NULL
+        stmt = (
+            insert(User)
+            .values(name=data.name, email=data.email, is_delete=False)
+            .returning(User.id, User.is_delete, User.created_at, User.updated_at)
+        )
+        try:
+            row = db.execute(stmt).one()
+        except SQLAlchemyError:
+            db.rollback()
+            raise
         self.commit_or_rollback(db)
 
-        db.refresh(new_user)
-        return new_user
+        return User(
+            id=row.id,
+            name=data.name,
+            email=data.email,
+            is_delete=row.is_delete,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
 
     def get_by_id(self, db: Session, uid: int) -> User | None:
-        return db.query(User).filter(User.id == uid).first()
+        # Session.get() checks the identity map before emitting SQL
+        user = db.get(User, uid)
+
+        # Soft-deleted users are treated as missing
+        if user is None or user.is_delete:
+            return None
+        return user
+
+    def get_row_by_id(self, db: Session, uid: int) -> Row[Any] | None:
+        """
+        Read-only lookup of an active user as a plain row (no ORM instance).
+        """
+        return db.execute(_GET_BY_ID, {"id": uid}).first()
 
     def get_by_email(self, db: Session, email: str) -> User | None:
-        return db.query(User).filter(User.email == email).first()
-
-    def list_users(self, db: Session, limit: int = 10, offset: int = 0):
-        total = db.query(func.count(User.id)).scalar() or 0
-
-        users = (
-            db.query(User)
-            .filter(User.is_delete.is_(None))
-            .order_by(User.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        # lambda_stmt caches the built statement; email becomes a bound param
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email))
+        return db.execute(stmt).scalars().first()
+
+    def list_users(
+        self,
+        db: Session,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: tuple[datetime, int] | None = None,
+    ):
+        """
+        Page through active users, newest first.
+
+        With a (created_at, id) cursor the page starts right after that
+        user (keyset pagination) and offset is ignored. Returns plain
+        Core rows rather than ORM instances.
+        """
+        if cursor is None:
+            # COUNT(*) OVER() returns the total alongside the page in one query
+            stmt = lambda_stmt(
+                lambda: select(
+                    User.id,
+                    User.name,
+                    User.email,
+                    User.created_at,
+                    User.updated_at,
+                    func.count().over().label("total"),
+                )
+                .where(User.is_delete.is_(False))
+                .offset(offset)
+            )
+        else:
+            created_at, uid = cursor
+            # The keyset filter narrows the window, so count the table instead.
+            # datetime() normalizes the bound value to the stored text format.
+            stmt = lambda_stmt(
+                lambda: select(
+                    User.id,
+                    User.name,
+                    User.email,
+                    User.created_at,
+                    User.updated_at,
+                    select(func.count(User.id))
+                    .where(User.is_delete.is_(False))
+                    .correlate(None)
+                    .scalar_subquery()
+                    .label("total"),
+                ).where(
+                    User.is_delete.is_(False),
+                    tuple_(User.created_at, User.id)
+                    < tuple_(func.datetime(created_at), uid),
+                )
+            )
+
+        stmt += lambda s: s.order_by(User.created_at.desc(), User.id.desc()).limit(
+            limit
         )
+        rows = db.execute(stmt).all()
 
-        return users, total
+        if rows:
+            total = rows[0].total
+        elif offset or cursor is not None:
+            # Page past the end: no row to carry the count
+            total = (
+                db.scalar(select(func.count(User.id)).where(User.is_delete.is_(False)))
+                or 0
+            )
+        else:
+            total = 0
 
-    def email_exists(self, db: Session, email: str) -> bool:
-        return self.get_by_email(db, email) is not None
+        return rows, total
 
     def email_exists_exclude_id(
         self, db: Session, email: str, exclude_id: int | None = None
     ) -> bool:
-        query = db.query(exists().where(User.email == email))
-
-        if exclude_id is not None:
-            query = query.filter(User.id != exclude_id)
+        row = db.execute(
+            _EMAIL_EXISTS, {"email": email, "exclude_id": exclude_id}
+        ).first()
+        return row is not None
+
+    def soft_delete(self, db: Session, uid: int) -> int | None:
+        """
+        Mark an active user as deleted in a single UPDATE ... RETURNING.
+
+        Returns the deleted id, or None when no active user matched.
+        """
+        stmt = (
+            update(User)
+            .where(User.id == uid, User.is_delete.is_(False))
+            .values(is_delete=True)
+            .returning(User.id)
+        )
+        deleted_id = db.execute(stmt).scalar_one_or_none()
+        self.commit_or_rollback(db)
 
-        return db.scalar(query)
+        return deleted_id
 
 
 # Singleton instance
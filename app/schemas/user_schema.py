@@ -3,9 +3,9 @@ Pydantic schemas for request and response validation.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Generic, List, Optional, TypeVar
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter
 
 
 class UserBase(BaseModel):
@@ -25,14 +25,30 @@ class UserUpdate(UserBase):
     pass
 
 
-class UserResponse(UserBase):
+class UserResponse(BaseModel):
     """Schema for user response data."""
 
+    # Plain str: emails are validated on write, not on every read
+    name: str = Field(..., description="User's full name")
+    email: str = Field(..., description="User's email address")
     id: int = Field(..., description="Unique user identifier")
     created_at: datetime = Field(..., description="User creation timestamp")
     updated_at: Optional[datetime] = Field(None, description="Last update timestamp")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+
+# Validates a whole page of rows in one pydantic-core call
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+
+
+class UserCursor(BaseModel):
+    """Keyset cursor pointing at the last user of a page."""
+
+    created_at: datetime = Field(..., description="created_at of the last user")
+    id: int = Field(..., description="id of the last user")
+
+    model_config = ConfigDict(frozen=True)
 
 
 class UserListResponse(BaseModel):
@@ -42,8 +58,22 @@ class UserListResponse(BaseModel):
     total: int = Field(..., description="Total number of users")
     limit: int = Field(..., description="Number of users per page")
     offset: int = Field(..., description="Number of users skipped")
+    next_cursor: Optional[UserCursor] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+
+DataT = TypeVar("DataT")
+
+
+class SuccessResponse(BaseModel, Generic[DataT]):
+    """Schema for the success envelope returned by the API."""
 
-    model_config = ConfigDict(from_attributes=True)
+    status: str = Field("success", description="Response status")
+    message: str = Field("Success", description="Response message")
+    data: DataT = Field(..., description="Response payload")
 
 
 class ErrorResponse(BaseModel):
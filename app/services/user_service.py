@@ -1,23 +1,32 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from app.exceptions.base import ConflictException, NotFoundException
+from app.exceptions.base import (
+    BadRequestException,
+    ConflictException,
+    NotFoundException,
+)
 from app.repositories.user_repository import user_repository
 from app.schemas.user_schema import (
+    USER_LIST_ADAPTER,
     UserCreate,
+    UserCursor,
     UserListResponse,
-    UserResponse,
     UserUpdate,
 )
 
 
 class UserService:
     def create_user(self, db: Session, data: UserCreate):
-        if user_repository.email_exists(db, data.email):
-            raise ConflictException("Email already exists")
-
-        return user_repository.create_user(db, data)
+        # The UNIQUE index on email rejects duplicates, no pre-check query
+        try:
+            return user_repository.create_user(db, data)
+        except IntegrityError:
+            raise ConflictException("Email already exists") from None
 
     def get_user(self, db: Session, uid: int):
-        user = user_repository.get_by_id(db, uid)
+        user = user_repository.get_row_by_id(db, uid)
         if user is None:
             raise NotFoundException(message="User is not found")
         return user
@@ -25,14 +34,44 @@ class UserService:
     def get_user_by_email(self, db: Session, email: str):
         return user_repository.get_by_email(db, email)
 
-    def list_users(self, db: Session, limit: int = 10, offset: int = 0):
-        users, total = user_repository.list_users(db, limit, offset)
-
-        return UserListResponse(
-            users=[UserResponse.model_validate(u) for u in users],
+    def list_users(
+        self,
+        db: Session,
+        limit: int = 10,
+        offset: int = 0,
+        after_created_at: datetime | None = None,
+        after_id: int | None = None,
+    ):
+        if (after_created_at is None) != (after_id is None):
+            raise BadRequestException(
+                "after_created_at and after_id must be provided together"
+            )
+        if after_id is not None and offset:
+            raise BadRequestException("offset cannot be combined with a cursor")
+
+        cursor = None
+        if after_created_at is not None and after_id is not None:
+            if after_created_at.tzinfo is not None:
+                # Timestamps are stored as naive UTC
+                after_created_at = after_created_at.astimezone(timezone.utc).replace(
+                    tzinfo=None
+                )
+            cursor = (after_created_at, after_id)
+
+        users, total = user_repository.list_users(db, limit, offset, cursor)
+
+        next_cursor = None
+        if len(users) == limit:
+            last = users[-1]
+            next_cursor = UserCursor(created_at=last.created_at, id=last.id)
+
+        # The page is validated in one batch; the envelope needs no validation
+        return UserListResponse.model_construct(
+            users=USER_LIST_ADAPTER.validate_python(users, from_attributes=True),
             total=total,
             limit=limit,
             offset=offset,
+            next_cursor=next_cursor,
         )
 
     def update_user_by_id(self, db: Session, uid: int, data: UserUpdate):
@@ -44,17 +83,21 @@ class UserService:
             if user_repository.email_exists_exclude_id(db, data.email, uid):
                 raise ConflictException("Email already exists")
 
-        return user_repository.update_by_id(db, uid, data.model_dump())
+        # Only write fields that actually change; a no-op PUT stays read-only
+        changes = {
+            k: v
+            for k, v in data.model_dump(exclude_unset=True).items()
+            if getattr(is_user, k) != v
+        }
+        if not changes:
+            return is_user
+
+        return user_repository.update_by_id(db, uid, changes, db_obj=is_user)
 
     def delete_user_by_id(self, db: Session, uid: int) -> str:
-        is_user = user_repository.get_by_id(db, uid)
-        if is_user is None:
+        if user_repository.soft_delete(db, uid) is None:
             raise NotFoundException(message="User is not found")
 
-        data = {"is_delete": True}
-
-        user_repository.update_by_id(db, uid, data)
-
         return "Deleted user successfully"
 
 
@@ -1,54 +1,52 @@
-from datetime import datetime
-from fastapi.responses import JSONResponse
+from typing import Any
 
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
 
-def serialize_data(data: any) -> any:
+
+def _json_response(content: dict, status_code: int) -> Response:
     """
-    Serialize different types of data to JSON-compatible format.
+    Render content to JSON bytes with orjson in a single pass.
 
     Args:
-        data (Any): The data to be serialized.
+        content (dict): JSON-compatible response body.
+        status_code (int): HTTP status code.
 
     Returns:
-        Any: Serialized data.
+        Response: application/json response.
     """
-    if hasattr(data, "__dict__"):
-        data_dict: dict[str, any] = data.__dict__
-        data = {k: v for k, v in data_dict.items() if not k.startswith("_")}
-        return serialize_data(data)
-    elif isinstance(data, dict):
-        return {key: serialize_data(value) for key, value in data.items()}
-    elif isinstance(data, (list, tuple)):
-        return [serialize_data(item) for item in data]
-    elif isinstance(data, datetime):
-        return data.isoformat()
-    elif isinstance(data, (str, int, float, bool, type(None))):
-        return data
-    else:
-        return str(data)
+    return Response(
+        content=orjson.dumps(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _payload(data: Any) -> Any:
+    """Dump Pydantic models once; dicts, lists and scalars pass through as-is."""
+    if isinstance(data, BaseModel):
+        return data.model_dump(mode="json")
+    return data
 
 
 def response_success(data=None, message="Success"):
-    return JSONResponse(
+    return _json_response(
+        {"status": "success", "message": message, "data": _payload(data)},
         status_code=200,
-        content={"status": "success", "message": message, "data": serialize_data(data)},
     )
 
 
 def response_created(data=None, message="Created"):
-    return JSONResponse(
+    return _json_response(
+        {"status": "success", "message": message, "data": _payload(data)},
         status_code=201,
-        content={"status": "success", "message": message, "data": serialize_data(data)},
     )
 
 
 def response_fail(message="Failed", status_code=400):
-    return JSONResponse(
-        status_code=status_code, content={"status": "fail", "message": message}
-    )
+    return _json_response({"status": "fail", "message": message}, status_code)
 
 
 def response_error(message="Server Error", status_code=500):
-    return JSONResponse(
-        status_code=status_code, content={"status": "error", "message": message}
-    )
+    return _json_response({"status": "error", "message": message}, status_code)
@@ -21,9 +21,6 @@ if command -v poetry &> /dev/null && [ -f "pyproject.toml" ]; then
         exit 1
     }
     
-    # Remove any existing test database
-    rm -f test.db test_*.db
-    
     echo "✅ Test dependencies check passed"
     echo "🔧 Running pytest with Poetry..."
     echo ""
@@ -51,9 +48,6 @@ else
         exit 1
     }
     
-    # Remove any existing test database
-    rm -f test.db test_*.db
-    
     echo "✅ Test dependencies check passed"
     echo "🔧 Running pytest..."
     echo ""
@@ -0,0 +1,194 @@
+"""
+Shared pytest configuration and fixtures.
+"""
+
+import contextvars
+import os
+import threading
+
+# Set before the app is imported, so the app's own engine never touches
+# ./users.db and each pytest-xdist worker gets a private in-memory database
+_worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+os.environ["DATABASE_URL"] = (
+    f"sqlite:///file:users_{_worker}?mode=memory&cache=shared&uri=true"
+)
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, event, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.config.database import Base, get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user_model import User  # noqa: E402
+
+# Create in-memory test database; StaticPool keeps one connection so every
+# session sees the same database
+SQLALCHEMY_DATABASE_URL = "sqlite://"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
+)
+
+
+# pysqlite manages transactions itself and breaks SAVEPOINT; let SQLAlchemy
+# emit BEGIN instead so each test can run inside a rolled-back transaction
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_begin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# The test connection is shared and not thread-safe; concurrent requests
+# (see the AsyncClient tests) take turns on it
+_db_lock = threading.Lock()
+
+
+# Session for the running test, set by the db_connection fixture; requests
+# reuse it instead of opening a session each
+_session_cv = contextvars.ContextVar("db_session")
+
+
+def override_get_db():
+    """Override database dependency for testing."""
+    # Look the session up before yielding, so errors thrown into the
+    # generator by the handler propagate unchanged
+    try:
+        db = _session_cv.get()
+    except LookupError:
+        db = None
+
+    with _db_lock:
+        if db is not None:
+            yield db
+            return
+
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+# Override the dependency
+app.dependency_overrides[get_db] = override_get_db
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    Create the database schema once for the whole test session.
+    """
+    Base.metadata.create_all(bind=engine)
+    yield engine
+
+
+@pytest.fixture(scope="module")
+def test_client(db_engine):
+    """
+    Create one test client shared by every test in the module.
+
+    Not entered as a context manager: the app's lifespan only runs
+    create_tables() on its own engine, which the tests never use.
+    """
+    client = TestClient(app)
+    yield client
+
+
+@pytest.fixture
+def anyio_backend():
+    """
+    Run the async tests on asyncio only.
+    """
+    return "asyncio"
+
+
+@pytest.fixture
+async def async_client(db_engine):
+    """
+    Create an in-process AsyncClient for issuing concurrent requests.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(autouse=True)
+def db_connection(db_engine):
+    """
+    Run each test inside a transaction that is rolled back afterwards.
+
+    Sessions join it through SAVEPOINTs, so commits made by the app only
+    release a savepoint and the rollback always leaves an empty database.
+    Every request in the test shares one session, closed on teardown.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    TestingSessionLocal.configure(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
+    session = TestingSessionLocal()
+    token = _session_cv.set(session)
+
+    yield connection
+
+    _session_cv.reset(token)
+    session.close()
+    transaction.rollback()
+    connection.close()
+    TestingSessionLocal.configure(bind=db_engine)
+
+
+@pytest.fixture
+def seed_users(db_connection):
+    """
+    Return a helper that inserts `count` users in one bulk INSERT.
+
+    Bypasses the API; rows are rolled back with the test's transaction.
+    """
+
+    def seed(count):
+        db = TestingSessionLocal()
+        try:
+            db.execute(
+                insert(User),
+                [
+                    {"name": f"User {i}", "email": f"user{i}@example.com"}
+                    for i in range(count)
+                ],
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    return seed
+
+
+@pytest.fixture
+def seed_users_raw(db_connection):
+    """
+    Return a helper that inserts `count` users through executemany.
+
+    Bypasses SQLAlchemy entirely; rows land in the test's connection, so
+    they are rolled back with it. created_at/is_delete use server defaults.
+    """
+
+    def seed(count):
+        cursor = db_connection.connection.cursor()
+        cursor.executemany(
+            "INSERT INTO users (name, email) VALUES (?, ?)",
+            [(f"User {i}", f"user{i}@example.com") for i in range(count)],
+        )
+        cursor.close()
+
+    return seed
@@ -0,0 +1,107 @@
+"""
+Tests for the SQLite engine configuration.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+
+from app.config import database
+from app.config.database import create_tables, set_sqlite_pragmas
+from app.repositories.user_repository import user_repository
+from app.schemas.user_schema import UserCreate
+
+# users table as created before is_delete got NOT NULL and a server default
+LEGACY_USERS_DDL = (
+    "CREATE TABLE users ("
+    "id INTEGER NOT NULL PRIMARY KEY, "
+    "name VARCHAR(100) NOT NULL, "
+    "email VARCHAR(255) NOT NULL UNIQUE, "
+    "is_delete BOOLEAN, "
+    "created_at DATETIME DEFAULT (CURRENT_TIMESTAMP) NOT NULL, "
+    "updated_at DATETIME)"
+)
+
+
+@pytest.fixture(scope="session")
+def file_engine(tmp_path_factory):
+    """
+    Engine on an on-disk database (WAL needs a real file).
+
+    Lives under pytest's temp dir (usually tmpfs) instead of the repo root.
+    """
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
+    )
+    event.listen(engine, "connect", set_sqlite_pragmas)
+
+    yield engine
+
+    engine.dispose()
+
+
+class TestSQLitePragmas:
+    """Test the PRAGMAs applied to every new connection."""
+
+    def test_pragmas_listener_registered(self):
+        """Test that the app engine runs set_sqlite_pragmas on connect."""
+        assert event.contains(database.engine, "connect", set_sqlite_pragmas)
+
+    def test_pragmas_applied(self, file_engine):
+        """Test that WAL and the tuned PRAGMAs are active on a fresh connection."""
+        with file_engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+            assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2  # MEMORY
+            assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -64000
+            assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+
+
+@pytest.fixture
+def legacy_engine():
+    """
+    The app's own engine, holding a pre-migration users table with one user.
+
+    The app engine is a per-worker in-memory database the API tests never
+    touch; the table is dropped afterwards.
+    """
+    engine = database.engine
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE IF EXISTS users")
+        conn.exec_driver_sql(LEGACY_USERS_DDL)
+        conn.exec_driver_sql(
+            "INSERT INTO users (name, email) VALUES ('Old', 'old@example.com')"
+        )
+
+    yield engine
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP TABLE users")
+
+
+class TestCreateTables:
+    """Test startup schema handling on databases from older versions."""
+
+    def test_legacy_users_stay_visible(self, legacy_engine):
+        """Test that old NULL rows are backfilled and new rows are active."""
+        create_tables()
+
+        db = database.SessionLocal()
+        try:
+            user_repository.create_user(
+                db, UserCreate(name="New", email="new@example.com")
+            )
+            rows, total = user_repository.list_users(db)
+        finally:
+            db.close()
+
+        assert total == 2
+        assert {row.name for row in rows} == {"Old", "New"}
+
+    def test_legacy_table_gets_list_index(self, legacy_engine):
+        """Test that indexes added since the table was created are built."""
+        create_tables()
+
+        with legacy_engine.connect() as conn:
+            indexes = {index["name"] for index in inspect(conn).get_indexes("users")}
+        assert "ix_users_active_created" in indexes
@@ -2,48 +2,15 @@
 Integration tests for the Users API endpoints.
 """
 
+import asyncio
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-from app.config.database import Base, get_db
-from app.main import app
-
-# Create test database
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def override_get_db():
-    """Override database dependency for testing."""
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
-
 
-# Override the dependency
-app.dependency_overrides[get_db] = override_get_db
-
-
-@pytest.fixture(scope="function")
-def test_client():
-    """
-    Create a test client with a fresh database for each test.
-    """
-    # Create tables
-    Base.metadata.create_all(bind=engine)
-
-    with TestClient(app) as client:
-        yield client
-
-    # Drop tables after test
-    Base.metadata.drop_all(bind=engine)
+# Reusable request payloads; copy with _clone() before mutating
+JOHN = {"name": "John Doe", "email": "john.doe@example.com"}
+_clone = dict.copy
 
 
 class TestHealthCheck:
@@ -64,7 +31,7 @@ class TestCreateUser:
 
     def test_create_user_success(self, test_client: TestClient):
         """Test successful user creation."""
-        user_data = {"name": "John Doe", "email": "john.doe@example.com"}
+        user_data = JOHN
 
         response = test_client.post("/users", json=user_data)
         assert response.status_code == 201
@@ -85,45 +52,36 @@ class TestCreateUser:
         assert data["updated_at"] is None
 
     def test_create_user_duplicate_email(self, test_client: TestClient):
-        """Test creating user with duplicate email returns 400."""
-        user_data = {"name": "John Doe", "email": "john.doe@example.com"}
+        """Test creating user with duplicate email returns 409."""
+        user_data = JOHN
 
         # Create first user
         response1 = test_client.post("/users", json=user_data)
         assert response1.status_code == 201
 
         # Try to create user with same email
-        user_data2 = {"name": "Jane Doe", "email": "john.doe@example.com"}  # Same email
+        user_data2 = _clone(JOHN)
+        user_data2["name"] = "Jane Doe"  # Same email
         response2 = test_client.post("/users", json=user_data2)
         assert response2.status_code == 409
 
         data = response2.json()
         assert "already exists" in data["message"]
 
-    def test_create_user_invalid_email(self, test_client: TestClient):
-        """Test creating user with invalid email format."""
-        user_data = {"name": "John Doe", "email": "invalid-email"}
-
-        response = test_client.post("/users", json=user_data)
-        assert response.status_code == 422
-
-    def test_create_user_missing_fields(self, test_client: TestClient):
-        """Test creating user with missing required fields."""
-        # Missing email
-        user_data = {"name": "John Doe"}
-        response = test_client.post("/users", json=user_data)
-        assert response.status_code == 422
-
-        # Missing name
-        user_data = {"email": "john@example.com"}
-        response = test_client.post("/users", json=user_data)
-        assert response.status_code == 422
-
-    def test_create_user_empty_name(self, test_client: TestClient):
-        """Test creating user with empty name."""
-        user_data = {"name": "", "email": "john@example.com"}
-
-        response = test_client.post("/users", json=user_data)
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(
+                {"name": "John Doe", "email": "invalid-email"}, id="invalid_email"
+            ),
+            pytest.param({"name": "John Doe"}, id="missing_email"),
+            pytest.param({"email": "john@example.com"}, id="missing_name"),
+            pytest.param({"name": "", "email": "john@example.com"}, id="empty_name"),
+        ],
+    )
+    def test_create_user_validation_fails(self, test_client: TestClient, payload):
+        """Test that invalid create payloads are rejected with 422."""
+        response = test_client.post("/users", json=payload)
         assert response.status_code == 422
 
 
@@ -141,18 +99,10 @@ class TestListUsers:
         assert data["data"]["limit"] == 10
         assert data["data"]["offset"] == 0
 
-    def test_list_users_with_data(self, test_client: TestClient):
+    def test_list_users_with_data(self, test_client: TestClient, seed_users):
         """Test listing users with data in database."""
         # Create test users
-        users_data = [
-            {"name": "John Doe", "email": "john@example.com"},
-            {"name": "Jane Smith", "email": "jane@example.com"},
-            {"name": "Bob Johnson", "email": "bob@example.com"},
-        ]
-
-        for user_data in users_data:
-            response = test_client.post("/users", json=user_data)
-            assert response.status_code == 201
+        seed_users(3)
 
         # List users
         response = test_client.get("/users")
@@ -172,24 +122,27 @@ class TestListUsers:
         assert data["limit"] == 10
         assert data["offset"] == 0
 
-        returned_names = [user["name"] for user in data["users"]]
-        assert "Bob Johnson" in returned_names
-
         user_names = [user["name"] for user in data["users"]]
-        assert "Bob Johnson" in user_names  # Last created should be first
+        assert user_names[0] == "User 2"  # Last created should be first
 
-    def test_list_users_pagination(self, test_client: TestClient):
+    @pytest.mark.anyio
+    async def test_list_users_pagination(
+        self, async_client: httpx.AsyncClient, seed_users_raw
+    ):
         """Test user listing with pagination parameters."""
         # Create 15 test users
-        for i in range(15):
-            user_data = {"name": f"User {i}", "email": f"user{i}@example.com"}
-            response = test_client.post("/users", json=user_data)
-            assert response.status_code == 201
+        seed_users_raw(15)
+
+        # The three pages are independent, so request them concurrently
+        first, second, last = await asyncio.gather(
+            async_client.get("/users?limit=5&offset=0"),
+            async_client.get("/users?limit=5&offset=5"),
+            async_client.get("/users?limit=5&offset=10"),
+        )
 
         # ==== First page ====
-        response = test_client.get("/users?limit=5&offset=0")
-        assert response.status_code == 200
-        resp = response.json()
+        assert first.status_code == 200
+        resp = first.json()
 
         assert resp["status"] == "success"
         assert "data" in resp
@@ -201,9 +154,8 @@ class TestListUsers:
         assert data["offset"] == 0
 
         # ==== Second page ====
-        response = test_client.get("/users?limit=5&offset=5")
-        assert response.status_code == 200
-        resp = response.json()
+        assert second.status_code == 200
+        resp = second.json()
         data = resp["data"]
 
         assert len(data["users"]) == 5
@@ -212,14 +164,58 @@ class TestListUsers:
         assert data["offset"] == 5
 
         # ==== Last page ====
-        response = test_client.get("/users?limit=5&offset=10")
-        assert response.status_code == 200
-        resp = response.json()
+        assert last.status_code == 200
+        resp = last.json()
         data = resp["data"]
 
         assert len(data["users"]) == 5
         assert data["total"] == 15
 
+    def test_list_users_cursor_pagination(
+        self, test_client: TestClient, seed_users_raw
+    ):
+        """Test keyset pagination with the returned next_cursor."""
+        seed_users_raw(7)
+
+        # ==== First page ====
+        response = test_client.get("/users?limit=5")
+        assert response.status_code == 200
+        data = response.json()["data"]
+
+        assert len(data["users"]) == 5
+        assert data["next_cursor"]["id"] == data["users"][-1]["id"]
+        first_ids = {user["id"] for user in data["users"]}
+
+        # ==== Next page from cursor ====
+        cursor = data["next_cursor"]
+        response = test_client.get(
+            "/users",
+            params={
+                "limit": 5,
+                "after_created_at": cursor["created_at"],
+                "after_id": cursor["id"],
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()["data"]
+
+        assert len(data["users"]) == 2
+        assert data["total"] == 7
+        assert data["next_cursor"] is None
+        assert first_ids.isdisjoint(user["id"] for user in data["users"])
+
+    def test_list_users_incomplete_cursor(self, test_client: TestClient):
+        """Test that both cursor parameters are required together."""
+        response = test_client.get("/users?after_id=1")
+        assert response.status_code == 400
+
+    def test_list_users_cursor_with_offset(self, test_client: TestClient):
+        """Test that offset is rejected in cursor mode instead of ignored."""
+        response = test_client.get(
+            "/users?offset=5&after_created_at=2024-01-01T00:00:00&after_id=1"
+        )
+        assert response.status_code == 400
+
     def test_list_users_invalid_pagination(self, test_client: TestClient):
         """Test user listing with invalid pagination parameters."""
         # Negative offset
@@ -235,20 +231,17 @@ class TestListUsers:
         assert response.status_code == 422
 
 
-class TestGetUser:
-    """Test individual user retrieval endpoint."""
+class TestUserLifecycle:
+    """Test the happy path of every verb on a single user."""
 
-    def test_get_user_success(self, test_client: TestClient):
-        """Test successful user retrieval by ID."""
-        # Create a user first
-        user_data = {"name": "John Doe", "email": "john@example.com"}
-        create_response = test_client.post("/users", json=user_data)
+    def test_user_lifecycle(self, test_client: TestClient):
+        """Create a user once, then get, update, delete and verify removal."""
+        # ==== Create ====
+        create_response = test_client.post("/users", json=JOHN)
         assert create_response.status_code == 201
+        created_id = create_response.json()["data"]["id"]
 
-        created = create_response.json()
-        created_id = created["data"]["id"]
-
-        # Get the user by ID
+        # ==== Get ====
         response = test_client.get(f"/users/{created_id}")
         assert response.status_code == 200
 
@@ -257,10 +250,42 @@ class TestGetUser:
         assert "data" in resp
 
         data = resp["data"]
+        assert data["id"] == created_id
+        assert data["name"] == JOHN["name"]
+        assert data["email"] == JOHN["email"]
 
+        # ==== Update only the name ====
+        update_data = {"name": "Johnny", "email": JOHN["email"]}
+        update_response = test_client.put(f"/users/{created_id}", json=update_data)
+        assert update_response.status_code == 200
+
+        data = update_response.json()["data"]
         assert data["id"] == created_id
-        assert data["name"] == user_data["name"]
-        assert data["email"] == user_data["email"]
+        assert data["name"] == "Johnny"
+        assert data["email"] == JOHN["email"]
+        assert data["updated_at"] is not None
+
+        # ==== Get reflects the update ====
+        response = test_client.get(f"/users/{created_id}")
+        assert response.status_code == 200
+        assert response.json()["data"]["name"] == "Johnny"
+
+        # ==== Delete ====
+        delete_res = test_client.delete(f"/users/{created_id}")
+        assert delete_res.status_code == 200
+        assert "success" in delete_res.json()["status"].lower()
+
+        list_res = test_client.get("/users")
+        users = list_res.json()["data"]["users"]
+        assert all(u["id"] != created_id for u in users)
+
+        # ==== Deleted user is gone for reads and repeated deletes ====
+        assert test_client.get(f"/users/{created_id}").status_code == 404
+        assert test_client.delete(f"/users/{created_id}").status_code == 404
+
+
+class TestGetUser:
+    """Test individual user retrieval endpoint."""
 
     def test_get_user_not_found(self, test_client: TestClient):
         """Test getting user that doesn't exist."""
@@ -274,28 +299,19 @@ class TestGetUser:
 class TestUpdateUser:
     """Test updating user endpoint."""
 
-    def test_update_user_success(self, test_client: TestClient):
-        """Test successful user update."""
-        # Create initial user
-        user_data = {"name": "John Doe", "email": "john@example.com"}
+    def test_update_user_no_changes(self, test_client: TestClient):
+        """Test that a PUT with identical data does not touch the user."""
+        user_data = JOHN
         create_response = test_client.post("/users", json=user_data)
         assert create_response.status_code == 201
+        created = create_response.json()["data"]
 
-        created = create_response.json()
-        created_id = created["data"]["id"]
-
-        # Update only the name
-        update_data = {"name": "Johnny", "email": created["data"]["email"]}
-        update_response = test_client.put(f"/users/{created_id}", json=update_data)
+        update_response = test_client.put(f"/users/{created['id']}", json=user_data)
         assert update_response.status_code == 200
 
-        updated = update_response.json()
-        data = updated["data"]
-
-        assert data["id"] == created_id
-        assert data["name"] == "Johnny"
-        assert data["email"] == "john@example.com"
-        assert data["updated_at"] is not None
+        data = update_response.json()["data"]
+        assert data == created
+        assert data["updated_at"] is None
 
     def test_update_user_duplicate_email(self, test_client: TestClient):
         """Test updating user with existing email should fail."""
@@ -330,27 +346,6 @@ class TestUpdateUser:
 class TestDeleteUser:
     """Test user deletion endpoint."""
 
-    def test_delete_user_success(self, test_client: TestClient):
-        """Test successfully deleting a user."""
-        # Create user
-        user_data = {"name": "To Delete", "email": "del@example.com"}
-        create_res = test_client.post("/users", json=user_data)
-        assert create_res.status_code == 201
-        created = create_res.json()["data"]
-
-        # Delete user
-        delete_res = test_client.delete(f"/users/{created['id']}")
-        assert delete_res.status_code == 200
-
-        data = delete_res.json()
-        assert "success" in data["status"].lower()
-
-        list_res = test_client.get("/users")
-        list_data = list_res.json()["data"]
-        users = list_data["users"]
-
-        assert all(u["id"] != created["id"] for u in users)
-
     def test_delete_user_not_found(self, test_client: TestClient):
         """Deleting non-existing user should return 404."""
         response = test_client.delete("/users/999")
@@ -363,27 +358,22 @@ class TestDeleteUser:
 class TestAPIDocumentation:
     """Test API documentation endpoints."""
 
-    def test_openapi_schema(self, test_client: TestClient):
-        """Test that OpenAPI schema is accessible."""
-        response = test_client.get("/openapi.json")
+    @pytest.mark.parametrize(
+        "path,content_type",
+        [
+            ("/openapi.json", "application/json"),
+            ("/docs", "text/html"),
+            ("/redoc", "text/html"),
+        ],
+    )
+    def test_docs_endpoints(self, test_client: TestClient, path, content_type):
+        """Test that the OpenAPI schema, Swagger UI and ReDoc are accessible."""
+        response = test_client.get(path)
         assert response.status_code == 200
+        assert content_type in response.headers["content-type"]
 
-        schema = response.json()
-        assert "openapi" in schema
-        assert "info" in schema
-        assert schema["info"]["title"] == "Users API"
-
-    def test_swagger_ui(self, test_client: TestClient):
-        """Test that Swagger UI is accessible."""
-        response = test_client.get("/docs")
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
-
-    def test_redoc(self, test_client: TestClient):
-        """Test that ReDoc is accessible."""
-        response = test_client.get("/redoc")
-        assert response.status_code == 200
-        assert "text/html" in response.headers["content-type"]
+        if path == "/openapi.json":
+            assert response.json()["info"]["title"] == "Users API"
 
 
 # Pytest configuration for running specific test classes
@@ -0,0 +1,41 @@
+"""
+Throughput benchmarks for the hot Users API endpoints.
+
+Skipped in regular runs (`--benchmark-skip` in addopts); run them with
+`pytest tests/test_users_bench.py --benchmark-only` or `make bench`.
+"""
+
+import itertools
+
+import orjson
+from fastapi.testclient import TestClient
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+class TestUsersThroughput:
+    """Benchmark the list and create endpoints."""
+
+    def test_list_users_throughput(
+        self, benchmark, test_client: TestClient, seed_users_raw
+    ):
+        """Benchmark listing a 50-user page out of 100."""
+        seed_users_raw(100)
+
+        response = benchmark(lambda: test_client.get("/users?limit=50"))
+        assert response.status_code == 200
+
+    def test_create_user_throughput(self, benchmark, test_client: TestClient):
+        """Benchmark creating users, each with a fresh email."""
+        counter = itertools.count()
+
+        def create():
+            i = next(counter)
+            # Encode with orjson up front rather than httpx's stdlib json
+            body = orjson.dumps(
+                {"name": f"Bench {i}", "email": f"bench{i}@example.com"}
+            )
+            return test_client.post("/users", content=body, headers=JSON_HEADERS)
+
+        response = benchmark(create)
+        assert response.status_code == 201